@@ -97,7 +97,8 @@ class Word(Base):
     __tablename__ = 'words'
 
     id = Column(Integer, primary_key=True)
-    utterance_id_fk = Column(Integer, ForeignKey('utterances.id'))
+    utterance_id_fk = Column(Integer, ForeignKey('utterances.id'),
+                             index=True)
     language = Column(Text)
     word = Column(Text)
     pos = Column(Text)
@@ -114,7 +115,7 @@ class Morpheme(Base):
 
     id = Column(Integer, primary_key=True)
     utterance_id_fk = Column(Integer, ForeignKey('utterances.id'))
-    word_id_fk = Column(Integer, ForeignKey('words.id'))
+    word_id_fk = Column(Integer, ForeignKey('words.id'), index=True)
     language = Column(Text)
     type = Column(Text)
     morpheme = Column(Text)
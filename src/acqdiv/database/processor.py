@@ -240,23 +240,42 @@ class DBProcessor:
         return w_id
 
     def insert_morphemes(self, morphemes, u_id, w_ids):
+        """Insert the morphemes of an utterance.
+
+        The morpheme IDs are not needed afterwards, so all morphemes of the
+        utterance are inserted with a single executemany.
+
+        Args:
+            morphemes (List[List[acqdiv.model.morpheme.Morpheme]]): The
+                morphemes grouped by word.
+            u_id (str): The utterance ID.
+            w_ids (List[str]): The word IDs.
+        """
         link_to_word = len(morphemes) == len(w_ids)
 
+        rows = []
         for i, mword in enumerate(morphemes):
             w_id = w_ids[i] if link_to_word else None
 
             for m in mword:
-                self.insert_morpheme(m, u_id, w_id)
+                rows.append(self.get_morpheme_row(m, u_id, w_id))
 
-    def insert_morpheme(self, m, u_id, w_id):
-        """Insert the morpheme.
+        if rows:
+            self.insert_morph_func(rows)
+
+    @staticmethod
+    def get_morpheme_row(m, u_id, w_id):
+        """Get the column values of the morpheme.
 
         Args:
             m (acqdiv.model.morpheme.Morpheme): The morpheme instance.
             u_id (str): The utterance ID.
             w_id (str): The word ID.
+
+        Returns:
+            dict: The column values.
         """
-        self.insert_morph_func(
+        return dict(
             utterance_id_fk=u_id,
             word_id_fk=w_id,
             language=m.morpheme_language if m.morpheme_language else None,
@@ -22,6 +22,7 @@ class Loader:
 
         db_dir = cfg['.global']['db_dir']
         db_processor = DBProcessor(db_dir=db_dir)
+        workers = cfg['.global'].getint('workers', fallback=1)
 
         for section in cfg.sections():
             # ignore sections starting with a dot
@@ -29,7 +30,7 @@ class Loader:
                 # get corpus parser based on corpus name
                 corpus_parser_class = CorpusParserMapper.map(section)
                 data = dict(cfg.items(section))
-                corpus_parser = corpus_parser_class(data)
+                corpus_parser = corpus_parser_class(data, workers=workers)
 
                 # get the corpus
                 corpus = corpus_parser.parse()
@@ -219,4 +219,4 @@ class CHATUtteranceCleaner:
     @classmethod
     def remove_commas(cls, utterance):
         """Remove commas from utterance."""
-        return re.sub(r',', '', utterance)
+        return utterance.replace(',', '')
@@ -1,7 +1,8 @@
-
-
 class Participant:
 
+    __slots__ = ('code', 'name', 'role', 'language', 'corpus', 'age', 'sex',
+                 'group', 'ses', 'education', 'custom', 'birth_date')
+
     def __init__(self):
         self.code = ''
         self.name = ''
@@ -12,7 +13,6 @@ class Participant:
         self.sex = ''
         self.group = ''
         self.ses = ''
-        self.role = ''
         self.education = ''
         self.custom = ''
         self.birth_date = ''
@@ -1,7 +1,8 @@
-
-
 class Record:
 
+    __slots__ = ('uid', 'participant_code', 'utterance', 'start_time',
+                 'end_time', 'dependent_tiers')
+
     def __init__(self):
         self.uid = -1
         self.participant_code = ''
@@ -34,6 +34,7 @@ class CHATParser(SessionParser):
 
         self.cleaner = self.get_cleaner()
         self.consistent_actual_target = True
+        self.speakers_by_label = {}
 
     @staticmethod
     def get_reader(session_file):
@@ -64,6 +65,7 @@ class CHATParser(SessionParser):
         session = Session()
         self.add_session_metadata(session)
         self.add_speakers(session)
+        self.speakers_by_label = self.get_speakers_by_label(session.speakers)
         self.add_records(session)
 
         return session
@@ -83,7 +85,7 @@ class CHATParser(SessionParser):
 
     def add_speakers(self, session):
         """Add the speakers to the session."""
-        while self.reader.load_next_speaker():
+        for _ in self.reader.iter_speakers():
             speaker = Speaker()
 
             speaker_label = self.reader.get_speaker_label()
@@ -126,20 +128,12 @@ class CHATParser(SessionParser):
 
     def add_records(self, session):
         """Add the records."""
-        while self.reader.load_next_record():
+        for _ in self.reader.iter_records():
             utt = self.add_utterance(session)
             self.add_words(utt)
             self.add_morphemes(utt)
             align_words_morphemes(utt)
 
-    @staticmethod
-    def _get_speaker(label, speakers):
-        for speaker in speakers:
-            if speaker.code == label:
-                return speaker
-
-        return None
-
     def add_utterance(self, session):
         """Add the utterance to the session."""
         utt = Utterance()
@@ -147,10 +141,10 @@ class CHATParser(SessionParser):
         utt.source_id = self.get_source_id()
         speaker_label = self.cleaner.clean_record_speaker_label(
             self.session_filename, self.reader.get_record_speaker_label())
-        utt.speaker = self._get_speaker(speaker_label, session.speakers)
+        utt.speaker = self._get_speaker(speaker_label)
         addressee_label = self.cleaner.clean_record_speaker_label(
             self.session_filename, self.reader.get_addressee())
-        utt.addressee = self._get_speaker(addressee_label, session.speakers)
+        utt.addressee = self._get_speaker(addressee_label)
         utt.childdirected = infer_childdirected(utt)
         utt.translation = self.cleaner.clean_translation(
             self.reader.get_translation())
@@ -198,16 +192,18 @@ class CHATParser(SessionParser):
         actual_words = self.reader.get_utterance_words(utt.actual_utterance)
         target_words = self.reader.get_utterance_words(utt.target_utterance)
 
-        for word_actual, word_target in zip(actual_words, target_words):
+        # choose the standard form once per utterance, not once per word
+        if self.reader.get_standard_form() == 'actual':
+            words = actual_words
+        else:
+            words = target_words
+
+        for word, word_actual, word_target in zip(
+                words, actual_words, target_words):
 
             w = Word()
             utt.words.append(w)
 
-            if self.reader.get_standard_form() == 'actual':
-                word = word_actual
-            else:
-                word = word_target
-
             w.word_language = self.reader.get_word_language(word)
             w.word = self.cleaner.clean_word(word)
             w.word_actual = self.cleaner.clean_word(word_actual)
@@ -254,18 +250,9 @@ class CHATParser(SessionParser):
             # collect morpheme data of a word
             wmorphemes = []
 
-            # get morphemes from the morpheme words
-            segments = self.reader.get_segments(cleaned_wseg)
-            glosses = self.reader.get_glosses(cleaned_wgloss)
-            poses = self.reader.get_poses(cleaned_wpos)
-
-            # determine number of morphemes to be considered
-            if self.reader.get_main_morpheme() == 'segment':
-                segments, glosses, poses = \
-                    fix_misalignments([segments, glosses, poses])
-            else:
-                glosses, segments, poses = \
-                    fix_misalignments([glosses, segments, poses])
+            # get aligned morphemes from the morpheme words
+            segments, glosses, poses = self.reader.get_morphology(
+                cleaned_wseg, cleaned_wgloss, cleaned_wpos)
 
             # go through morphemes
             for seg, gloss, pos in zip(segments, glosses, poses):
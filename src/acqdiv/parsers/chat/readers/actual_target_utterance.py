@@ -1,6 +1,24 @@
 import re
 
 
+# Patterns are compiled once here since they are applied to every utterance.
+# The methods check for a literal part of their pattern first, which lets
+# utterances without the respective coding skip the regex engine.
+_shortening_regex = re.compile(r'(?<=\S)\((\S+?)\)|\((\S+?)\)(?=\S)')
+_replacement_regex1 = re.compile(r'<(.*?)> ?\[: .*?\]')
+_replacement_regex2 = re.compile(r'(\S+) ?\[: .*?\]')
+_replacement_target_regex = re.compile(r'(?:<.*?>|\S+) ?\[: (.*?)\]')
+_fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
+_retracing_regex1 = re.compile(r'<(.*?)> ?\[(/{1,3}|/-)\]')
+_retracing_regex2 = re.compile(r'(\S+) ?\[(/{1,3}|/-)\]')
+_retracing_target_regex = re.compile(r'([^>\s]+) ?\[//\] (\S+)')
+
+
+def _join_replacing_words(match):
+    """Join the replacing words of a replacement by underscores."""
+    return match.group(1).replace(' ', '_')
+
+
 class ActualTargetUtteranceExtractor:
     """Methods for extracting actual and target utterances."""
 
@@ -31,8 +49,11 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: parentheses within word.
         The part with parentheses is removed.
         """
-        shortening_regex = re.compile(r'(?<=\S)\(\S+?\)|\(\S+?\)(?=\S)')
-        return shortening_regex.sub('', utterance)
+        # most utterances contain no parentheses at all
+        if '(' not in utterance:
+            return utterance
+
+        return _shortening_regex.sub('', utterance)
 
     @staticmethod
     def get_shortening_target(utterance):
@@ -41,8 +62,10 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: parentheses within word.
         The part in parentheses is kept, parentheses are removed.
         """
-        shortening_regex = re.compile(r'(?<=\S)\((\S+?)\)|\((\S+?)\)(?=\S)')
-        return shortening_regex.sub(r'\1\2', utterance)
+        if '(' not in utterance:
+            return utterance
+
+        return _shortening_regex.sub(r'\1\2', utterance)
 
     @staticmethod
     def get_replacement_actual(utterance):
@@ -51,12 +74,13 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: [: <words>] .
         Keeps replaced words, removes replacing words with brackets.
         """
+        if '[: ' not in utterance:
+            return utterance
+
         # several scoped words
-        replacement_regex1 = re.compile(r'<(.*?)> ?\[: .*?\]')
-        clean = replacement_regex1.sub(r'\1', utterance)
+        clean = _replacement_regex1.sub(r'\1', utterance)
         # one scoped word
-        replacement_regex2 = re.compile(r'(\S+) ?\[: .*?\]')
-        return replacement_regex2.sub(r'\1', clean)
+        return _replacement_regex2.sub(r'\1', clean)
 
     @staticmethod
     def get_replacement_target(utterance):
@@ -67,12 +91,10 @@ class ActualTargetUtteranceExtractor:
         is more than one replacing word, they are joined together by an
         underscore.
         """
-        replacement_regex = re.compile(r'(?:<.*?>|\S+) ?\[: (.*?)\]')
-
-        def x(match):
-            return match.group(1).replace(' ', '_')
+        if '[: ' not in utterance:
+            return utterance
 
-        return replacement_regex.sub(x, utterance)
+        return _replacement_target_regex.sub(_join_replacing_words, utterance)
 
     @staticmethod
     def get_fragment_actual(utterance):
@@ -81,8 +103,10 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: word starting with &.
         Keeps the fragment, removes the & from the word.
         """
-        fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
-        return fragment_regex.sub(r'\1\2', utterance)
+        if '&' not in utterance:
+            return utterance
+
+        return _fragment_regex.sub(r'\1\2', utterance)
 
     @staticmethod
     def get_fragment_target(utterance):
@@ -91,8 +115,10 @@ class ActualTargetUtteranceExtractor:
         Coding in CHAT: word starting with &.
         The fragment is marked as untranscribed (xxx).
         """
-        fragment_regex = re.compile(r'(^|\s)&([^-=\s]\S*)')
-        return fragment_regex.sub(r'\1xxx', utterance)
+        if '&' not in utterance:
+            return utterance
+
+        return _fragment_regex.sub(r'\1xxx', utterance)
 
     @staticmethod
     def get_retracing_actual(utterance):
@@ -102,12 +128,13 @@ class ActualTargetUtteranceExtractor:
 
         Removal of retracing markers.
         """
+        if '[/' not in utterance:
+            return utterance
+
         # several scoped words
-        retracing_regex1 = re.compile(r'<(.*?)> ?\[(/{1,3}|/-)\]')
-        clean = retracing_regex1.sub(r'\1', utterance)
+        clean = _retracing_regex1.sub(r'\1', utterance)
         # one scoped word
-        retracing_regex2 = re.compile(r'(\S+) ?\[(/{1,3}|/-)\]')
-        return retracing_regex2.sub(r'\1', clean)
+        return _retracing_regex2.sub(r'\1', clean)
 
     @classmethod
     def get_retracing_target(cls, utterance):
@@ -121,7 +148,9 @@ class ActualTargetUtteranceExtractor:
         being corrected cannot be replaced by their target forms since the
         correcting part can be of variable length.
         """
+        if '[/' not in utterance:
+            return utterance
+
         # single-word correction
-        retracing_regex = re.compile(r'([^>\s]+) ?\[//\] (\S+)')
-        utterance = retracing_regex.sub(r'\2 \2', utterance)
+        utterance = _retracing_target_regex.sub(r'\2 \2', utterance)
         return cls.get_retracing_actual(utterance)
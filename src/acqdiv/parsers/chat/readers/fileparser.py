@@ -1,10 +1,19 @@
 import re
+from operator import itemgetter
+from sys import intern
 
 from acqdiv.parsers.chat.model.chat import CHAT
 from acqdiv.parsers.chat.model.participant import Participant
 from acqdiv.parsers.chat.model.record import Record
 
 
+# Patterns are compiled once here. The methods below run for every line or
+# record of a session, so do not compile literal patterns inside them.
+_metadata_regex = re.compile(r'@.*?:\t')
+_record_start_regex = re.compile(r'\*[A-Za-z0-9]{2,3}:\t')
+_mainline_label_regex = re.compile(r'\*([A-Za-z0-9]{2,3}):\t')
+
+
 class CHATFileParser:
     """Methods for creating a CHAT instance."""
 
@@ -19,7 +28,8 @@ class CHATFileParser:
             CHAT: The CHAT instance.
         """
         chat = CHAT()
-        session = session_file.read()
+        # replace line breaks once for headers and records
+        session = cls._replace_line_breaks(session_file.read())
         cls.add_headers(chat, session)
         cls.add_records(chat, session)
 
@@ -108,6 +118,9 @@ class CHATFileParser:
         CHAT inserts a line break and a tab when a tier or field becomes too
         long. The line breaks are replaced by a blank space.
 
+        The replacement is idempotent. If there are no line breaks left,
+        `str.replace` returns the session itself without copying it.
+
         Args:
             session (str): The session.
 
@@ -132,11 +145,20 @@ class CHATFileParser:
         Yields:
             str: The next metadata field.
         """
-        metadata_regex = re.compile(r'@.*?:\t')
         session = cls._replace_line_breaks(session)
-        for match in re.finditer(r'[^\n]+', session):
-            line = match.group()
-            if metadata_regex.search(line):
+        start = 0
+        length = len(session)
+
+        # walk the lines until the metadata section ends
+        while start < length:
+            end = session.find('\n', start)
+            if end == -1:
+                end = length
+
+            line = session[start:end]
+            start = end + 1
+
+            if _metadata_regex.search(line):
                 yield line
 
             # metadata section ends
@@ -148,7 +170,7 @@ class CHATFileParser:
         """Get the key and content of the metadata field.
 
         The key is the part within the @ and the colon. The content is the
-        part after the tab.
+        part after the first tab following the colon.
 
         Args:
             metadata_field (str): The metadata field as returned by
@@ -157,8 +179,8 @@ class CHATFileParser:
         Returns:
             tuple: (key, content).
         """
-        key, content = metadata_field.split(':\t')
-        return key.lstrip('@'), content
+        key, _, content = metadata_field.partition(':\t')
+        return intern(key.lstrip('@')), content
 
     # ---------- @Media ----------
 
@@ -205,7 +227,8 @@ class CHATFileParser:
     def iter_participants(participants):
         """Iter participants in @Participants.
 
-        @Participants is a comma-separated list of participants.
+        @Participants is a comma-separated list of participants. Blank
+        spaces around the commas are removed.
 
         Args:
             participants (str): @Participants content.
@@ -213,9 +236,10 @@ class CHATFileParser:
         Yields:
             str: The next participant.
         """
-        participants_regex = re.compile(r'\s*,\s*')
-        for participant in participants_regex.split(participants):
-            yield participant
+        for participant in participants.split(','):
+            participant = participant.strip()
+            if participant:
+                yield participant
 
     @staticmethod
     def get_participant_fields(participant):
@@ -235,7 +259,9 @@ class CHATFileParser:
         Returns:
             tuple: (label, name, role).
         """
-        fields = re.split(r'\s+', participant)
+        fields = participant.split() or ['']
+        # labels recur in every record, so share one string object per label
+        fields[0] = intern(fields[0])
         # name and role is missing
         if len(fields) == 1:
             return fields[0], '', ''
@@ -264,7 +290,8 @@ class CHATFileParser:
         """Get the fields of @ID.
 
         @ID consists of the following fields: language, corpus, code, age,
-        sex, group, SES, role, education, custom.
+        sex, group, SES, role, education, custom. Missing trailing fields
+        are returned as empty strings.
 
         Args:
             id_field (str): @ID content.
@@ -273,47 +300,23 @@ class CHATFileParser:
             tuple: (language, corpus, code, age, sex, group, SES, role,
                     education, custom)
         """
-        return tuple(id_field[:-1].split('|'))
-
-    @staticmethod
-    def get_id_language(id_fields):
-        return id_fields[0]
-
-    @staticmethod
-    def get_id_corpus(id_fields):
-        return id_fields[1]
-
-    @staticmethod
-    def get_id_code(id_fields):
-        return id_fields[2]
-
-    @staticmethod
-    def get_id_age(id_fields):
-        return id_fields[3]
-
-    @staticmethod
-    def get_id_sex(id_fields):
-        return id_fields[4]
-
-    @staticmethod
-    def get_id_group(id_fields):
-        return id_fields[5]
-
-    @staticmethod
-    def get_id_ses(id_fields):
-        return id_fields[6]
-
-    @staticmethod
-    def get_id_role(id_fields):
-        return id_fields[7]
-
-    @staticmethod
-    def get_id_education(id_fields):
-        return id_fields[8]
-
-    @staticmethod
-    def get_id_custom(id_fields):
-        return id_fields[9]
+        fields = id_field[:-1].split('|', 9)
+        if len(fields) < 10:
+            fields += [''] * (10 - len(fields))
+
+        return tuple(fields)
+
+    # accessors of the fields returned by `get_id_fields`
+    get_id_language = staticmethod(itemgetter(0))
+    get_id_corpus = staticmethod(itemgetter(1))
+    get_id_code = staticmethod(itemgetter(2))
+    get_id_age = staticmethod(itemgetter(3))
+    get_id_sex = staticmethod(itemgetter(4))
+    get_id_group = staticmethod(itemgetter(5))
+    get_id_ses = staticmethod(itemgetter(6))
+    get_id_role = staticmethod(itemgetter(7))
+    get_id_education = staticmethod(itemgetter(8))
+    get_id_custom = staticmethod(itemgetter(9))
 
     # ---------- Record ----------
 
@@ -329,12 +332,28 @@ class CHATFileParser:
             str: The next record.
         """
         session = cls._replace_line_breaks(session)
-        rec_regex = re.compile(r'\*[A-Za-z0-9]{2,3}:\t.*?(?=\n\*|\n@End)',
-                               flags=re.DOTALL)
+        match = _record_start_regex.search(session)
+        records_end = session.find('\n@End', match.start()) if match else -1
+
         # iter all records
-        for match in rec_regex.finditer(session):
-            rec = match.group()
-            yield rec
+        while match:
+            start = match.start()
+            if records_end != -1 and start > records_end:
+                records_end = session.find('\n@End', start)
+
+            # a record ends before the next main line or @End
+            if records_end == -1:
+                end = session.find('\n*', start)
+            else:
+                end = session.find('\n*', start, records_end)
+                if end == -1:
+                    end = records_end
+            if end == -1:
+                break
+
+            yield session[start:end]
+
+            match = _record_start_regex.search(session, end)
 
     # ---------- Main line ----------
 
@@ -342,14 +361,16 @@ class CHATFileParser:
     def get_mainline(cls, rec):
         """Get the main line of the record.
 
+        The main line is the first line of the record.
+
         Args:
             rec (str): The record.
 
         Returns:
             str: The main line.
         """
-        main_line_regex = re.compile(r'^\*.*')
-        return main_line_regex.search(rec).group()
+        main_line, _, _ = rec.partition('\n')
+        return main_line
 
     @staticmethod
     def get_mainline_fields(main_line):
@@ -364,24 +385,62 @@ class CHATFileParser:
         Returns:
             tuple: (speaker ID, utterance, start time, end time).
         """
-        main_line_regex = re.compile(
-            r'\*([A-Za-z0-9]{2,3}):\t(.*?)(\s*\D?(\d+)(_(\d+))?\D?$|$)')
-        match = main_line_regex.search(main_line)
-        label = match.group(1)
-        utterance = match.group(2)
-
-        if match.group(4):
-            start = match.group(4)
-        else:
-            start = ''
-
-        if match.group(6):
-            end = match.group(6)
-        else:
-            end = ''
+        match = _mainline_label_regex.search(main_line)
+        label = intern(match.group(1))
+        utterance, start, end = CHATFileParser._split_time(
+            main_line[match.end():])
 
         return label, utterance, start, end
 
+    @staticmethod
+    def _split_time(content):
+        """Split the trailing time stamp off the main line content.
+
+        The time stamp consists of the start time, optionally followed by an
+        underscore and the end time. It may be preceded by blank spaces and
+        one delimiter (e.g. a bullet) and followed by one delimiter. The
+        content is scanned backwards from its end.
+
+        Args:
+            content (str): The main line without the speaker label.
+
+        Returns:
+            tuple: (utterance, start time, end time).
+        """
+        pos = len(content)
+
+        # closing delimiter
+        if pos and not content[pos-1].isdecimal():
+            pos -= 1
+
+        time_end = pos
+        while pos and content[pos-1].isdecimal():
+            pos -= 1
+
+        # no time stamp
+        if pos == time_end:
+            return content, '', ''
+
+        start = content[pos:time_end]
+        end = ''
+
+        # start and end time separated by an underscore
+        if pos > 1 and content[pos-1] == '_' and content[pos-2].isdecimal():
+            end = start
+            time_end = pos - 1
+            pos = time_end
+            while pos and content[pos-1].isdecimal():
+                pos -= 1
+            start = content[pos:time_end]
+
+        # opening delimiter and blank spaces
+        if pos and not content[pos-1].isdecimal():
+            pos -= 1
+        while pos and content[pos-1].isspace():
+            pos -= 1
+
+        return content[:pos], start, end
+
     @staticmethod
     def get_mainline_speaker_id(main_line_fields):
         return main_line_fields[0]
@@ -412,9 +471,12 @@ class CHATFileParser:
         Yields:
             str: The next dependent tier.
         """
-        dependent_tier_regex = re.compile(r'(?<=\n)%.*')
-        for dependent_tier in dependent_tier_regex.finditer(rec):
-            yield dependent_tier.group()
+        lines = iter(rec.split('\n'))
+        # skip the main line
+        next(lines, None)
+        for line in lines:
+            if line.startswith('%'):
+                yield line
 
     @staticmethod
     def get_dependent_tier(dependent_tier):
@@ -430,10 +492,9 @@ class CHATFileParser:
         Returns:
             tuple: (key, content).
         """
-        try:
-            key, content = dependent_tier.split(':\t')
+        key, sep, content = dependent_tier.partition(':\t')
         # TODO: delete this once the source data (Inuktitut) is fixed
-        except ValueError:
-            key, content = dependent_tier.split(': ', maxsplit=1)
+        if not sep:
+            key, _, content = dependent_tier.partition(': ')
 
-        return key.lstrip('%'), content
+        return intern(key.lstrip('%')), content
@@ -1,5 +1,4 @@
-import re
-
+from acqdiv.util.alignment import fix_misalignments
 from acqdiv.parsers.chat.readers.fileparser import CHATFileParser
 from acqdiv.parsers.chat.readers.actual_target_utterance \
     import ActualTargetUtteranceExtractor
@@ -10,6 +9,9 @@ from acqdiv.parsers.chat.readers.sentence_type \
 class CHATReader:
     """Methods for reading CHAT files."""
 
+    __slots__ = ('chat', 'participant_iterator', 'participant',
+                 'record_iterator', 'record')
+
     def __init__(self, session_file):
         """Set the variables.
         chat (acqdiv.parsers.chat.model.CHAT): The chat instance.
@@ -69,6 +71,18 @@ class CHATReader:
 
         return 1
 
+    def iter_speakers(self):
+        """Iter the speakers of the session.
+
+        Each speaker is loaded before it is yielded, so that the speaker
+        getters (e.g. `get_speaker_label`) refer to the yielded speaker.
+
+        Yields:
+            acqdiv.parsers.chat.model.participant.Participant: The speaker.
+        """
+        while self.load_next_speaker():
+            yield self.participant
+
     def get_speaker_age(self):
         """Get the age of the speaker.
 
@@ -133,6 +147,18 @@ class CHATReader:
 
         return 1
 
+    def iter_records(self):
+        """Iter the records of the session.
+
+        Each record is loaded before it is yielded, so that the record
+        getters (e.g. `get_utterance`) refer to the yielded record.
+
+        Yields:
+            acqdiv.parsers.chat.model.record.Record: The record.
+        """
+        while self.load_next_record():
+            yield self.record
+
     def get_uid(self):
         """Get the ID of the utterance.
 
@@ -215,13 +241,12 @@ class CHATReader:
 
         Returns: str
         """
-        comments = self.record.dependent_tiers.get('com', '')
-        situation = self.record.dependent_tiers.get('sit', '')
-        action = self.record.dependent_tiers.get('act', '')
-        explanation = self.record.dependent_tiers.get('exp', '')
-        fields = [comments, situation, action, explanation]
+        tiers = self.record.dependent_tiers
+        # comments, situation, action, explanation
+        fields = [tiers[key] for key in ('com', 'sit', 'act', 'exp')
+                  if tiers.get(key)]
 
-        return '; '.join((f for f in fields if f))
+        return '; '.join(fields)
 
     def get_morph_tier(self):
         """Get the morphology tier.
@@ -269,7 +294,7 @@ class CHATReader:
             list: The words.
         """
         if utterance:
-            return re.split(r'\s+', utterance)
+            return utterance.split()
         else:
             return []
 
@@ -358,6 +383,34 @@ class CHATReader:
         """
         return cls.get_morphemes(pos_word)
 
+    def get_morphology(self, seg_word, gloss_word, pos_word):
+        """Get the segments, glosses and POS tags of a word.
+
+        The three lists are aligned by index and always have the same
+        length. In case of misalignments, only the main morphemes are kept
+        (see `get_main_morpheme`), while the others are nulled.
+
+        Args:
+            seg_word (str): The segment word.
+            gloss_word (str): The gloss word.
+            pos_word (str): The POS word.
+
+        Returns:
+            Tuple[list, list, list]: (segments, glosses, POS tags).
+        """
+        segments = self.get_segments(seg_word)
+        glosses = self.get_glosses(gloss_word)
+        poses = self.get_poses(pos_word)
+
+        if self.get_main_morpheme() == 'segment':
+            segments, glosses, poses = fix_misalignments(
+                [segments, glosses, poses])
+        else:
+            glosses, segments, poses = fix_misalignments(
+                [glosses, segments, poses])
+
+        return segments, glosses, poses
+
     @staticmethod
     def get_morpheme_language(seg, gloss, pos):
         """Get language of the morpheme.
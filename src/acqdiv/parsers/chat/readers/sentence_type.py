@@ -1,4 +1,5 @@
-import re
+# characters terminators consist of
+_terminator_chars = frozenset('+/.!?"')
 
 
 class SentenceTypeExtractor:
@@ -20,12 +21,39 @@ class SentenceTypeExtractor:
 
     @staticmethod
     def get_utterance_terminator(utterance):
-        terminator_regex = re.compile(r'([+/.!?"]*[!?.])(?=(\s*\[\+|\s*$))')
-        match = terminator_regex.search(utterance)
-        if match:
-            return match.group(1)
-        else:
-            return ''
+        """Get the terminator of the utterance.
+
+        Terminators are followed by a postcode ([+ ...]) or the end of the
+        utterance. They consist of the characters +/.!?" and end in one of
+        !?. . If there are several, the first one is returned.
+
+        Args:
+            utterance (str): The utterance.
+
+        Returns:
+            str: The terminator or an empty string if there is none.
+        """
+        # try the text before each postcode and then the whole utterance
+        postcode_start = utterance.find('[+')
+        while True:
+            if postcode_start == -1:
+                text = utterance.rstrip()
+            else:
+                text = utterance[:postcode_start].rstrip()
+
+            # scan the terminator characters backwards from the end
+            start = len(text)
+            while start and text[start-1] in _terminator_chars:
+                start -= 1
+
+            terminator = text[start:]
+            if terminator and terminator[-1] in '!?.':
+                return terminator
+
+            if postcode_start == -1:
+                return ''
+
+            postcode_start = utterance.find('[+', postcode_start + 1)
 
     @staticmethod
     def terminator2sentence_type(terminator):
@@ -8,16 +8,40 @@ from acqdiv.parsers.corpora.main.chintang.gloss_mapper \
 from acqdiv.parsers.corpora.main.chintang.pos_mapper \
     import ChintangPOSMapper
 
+_punctuation_regex = re.compile('[‘’\'“”\".!,:?+/]')
+
 
 class ChintangCleaner(ToolboxCleaner):
 
+    # morpheme language codes mapped to language names
+    _languages = {
+        'C': 'Chintang',
+        'N': 'Nepali',
+        'E': 'English',
+        'C/N': 'Nepali',
+        'N/E': 'Nepali',
+        'C/N/E': 'English',
+        'B': 'Bantawa',
+        'C/B': 'Chintang/Bantawa',
+        'C(M)': 'Chintang',
+        'C(S)': 'Chintang',
+        'C/E': 'English',
+        'C/E/N': 'English',
+        'C/N/H': 'Hindi',
+        'C+N': 'Chintang/Nepali',
+        'H': 'Hindi',
+        'N/Arabic': 'Arabic',
+        'N/H': 'Hindi',
+        '***': 'Chintang'
+    }
+
     @staticmethod
     def remove_punctuation(seg_tier):
-        return re.sub('[‘’\'“”\".!,:?+/]', '', seg_tier)
+        return _punctuation_regex.sub('', seg_tier)
 
     @staticmethod
     def unify_unknown_seg_tier(seg_tier):
-        return re.sub('\*\*\*', '???', seg_tier)
+        return seg_tier.replace('***', '???')
 
     @classmethod
     def clean_seg_tier(cls, seg_tier):
@@ -40,32 +64,7 @@ class ChintangCleaner(ToolboxCleaner):
 
     @classmethod
     def clean_lang(cls, lang):
-        languages = {
-            'C': 'Chintang',
-            'N': 'Nepali',
-            'E': 'English',
-            'C/N': 'Nepali',
-            'N/E': 'Nepali',
-            'C/N/E': 'English',
-            'B': 'Bantawa',
-            'C/B': 'Chintang/Bantawa',
-            'C(M)': 'Chintang',
-            'C(S)': 'Chintang',
-            'C/E': 'English',
-            'C/E/N': 'English',
-            'C/N/H': 'Hindi',
-            'C+N': 'Chintang/Nepali',
-            'H': 'Hindi',
-            'N/Arabic': 'Arabic',
-            'N/H': 'Hindi',
-            '***': 'Chintang'
-        }
-
-        lang = lang.strip('-')
-        if lang in languages:
-            return languages[lang]
-        else:
-            return 'Chintang'
+        return cls._languages.get(lang.strip('-'), 'Chintang')
 
     @staticmethod
     def unify_unknown_morpheme(id_):
@@ -3,6 +3,8 @@ from acqdiv.parsers.chat.readers.reader import CHATReader
 
 class CreeReader(CHATReader):
 
+    __slots__ = ()
+
     @staticmethod
     def get_main_morpheme():
         return 'segment'
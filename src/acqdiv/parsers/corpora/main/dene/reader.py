@@ -3,6 +3,8 @@ from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 class DeneReader(ToolboxReader):
 
+    __slots__ = ()
+
     @classmethod
     def get_actual_utterance(cls, rec):
         return rec.get('full', '')
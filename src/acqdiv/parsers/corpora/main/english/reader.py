@@ -3,8 +3,15 @@ import re
 from acqdiv.parsers.chat.readers.reader import CHATReader
 
 
+_morpheme_regex = re.compile(r'[^#]+#'
+                             r'|[^\-]+'
+                             r'|[\-][^\-]+')
+
+
 class EnglishManchester1Reader(CHATReader):
 
+    __slots__ = ()
+
     # TODO: move all corrections to cleaner
 
     @staticmethod
@@ -105,10 +112,6 @@ class EnglishManchester1Reader(CHATReader):
         Returns:
             tuple: (segment, gloss, pos).
         """
-        morpheme_regex = re.compile(r'[^#]+#'
-                                    r'|[^\-]+'
-                                    r'|[\-][^\-]+')
-
         # split into word groups (in case of compound, clitic) (if applicable)
         word_groups = re.split(r'[+~]', morph_word)
 
@@ -131,7 +134,7 @@ class EnglishManchester1Reader(CHATReader):
                 stem_gloss = ''
 
             # iter morphemes
-            for match in morpheme_regex.finditer(word_group):
+            for match in _morpheme_regex.finditer(word_group):
                 morpheme = match.group()
 
                 # prefix
@@ -1,6 +1,8 @@
 import re
 from acqdiv.util.age import get_age_from_birth_date_session_date, get_age_in_days
 
+_age_regex = re.compile(r'P(\d*)Y(\d*)?M?(\d*)?D?')
+
 
 class IndonesianAgeUpdater:
 
@@ -42,7 +44,7 @@ class IndonesianAgeUpdater:
             str: The age in the format YY;MM.DD.
         """
         age_raw = age_raw.split('/')[0]
-        age = re.match(r'P(\d*)Y(\d*)?M?(\d*)?D?', age_raw)
+        age = _age_regex.match(age_raw)
         if age:
             if age.group(3) != '':
                 days = age.group(3)
@@ -5,6 +5,8 @@ from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 class IndonesianReader(ToolboxReader):
 
+    __slots__ = ()
+
     @classmethod
     def get_source_id(cls, rec):
         return rec.get('id', '')
@@ -65,7 +65,7 @@ class IndonesianSessionParser(ToolboxParser):
         utt = super().add_utterance(rec)
         speaker_label = self.record_reader.get_speaker_label(rec)
         speaker_label = Lc.correct_rec_label(speaker_label)
-        utt.speaker = self._get_speaker(speaker_label, self.session.speakers)
+        utt.speaker = self._get_speaker(speaker_label)
 
         return utt
 
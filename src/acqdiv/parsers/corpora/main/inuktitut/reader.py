@@ -3,9 +3,17 @@ import re
 from acqdiv.parsers.chat.readers.reader import CHATReader
 
 
+_replacement_regex = re.compile(r'(?:<.*?>|\S+) \[=\? (.*?)\]')
+_alternative_regex1 = re.compile(r'<(.*?)> \[=\? .*?\]')
+_alternative_regex2 = re.compile(r'(\S+) \[=\? .*?\]')
+_morpheme_regex = re.compile(r'(.*)\|(.*?)\^(.*)')
+
+
 class InuktitutReader(CHATReader):
     """Inferences for Inuktitut."""
 
+    __slots__ = ()
+
     def get_start_time(self):
         return self.record.dependent_tiers.get('tim', '')
 
@@ -19,8 +27,7 @@ class InuktitutReader(CHATReader):
         Coding in CHAT: [=? <words>]
         The actual form is the alternative given in brackets.
         """
-        replacement_regex = re.compile(r'(?:<.*?>|\S+) \[=\? (.*?)\]')
-        return replacement_regex.sub(r'\1', utterance)
+        return _replacement_regex.sub(r'\1', utterance)
 
     @staticmethod
     def get_target_alternative(utterance):
@@ -30,11 +37,9 @@ class InuktitutReader(CHATReader):
         The target form is the original form.
         """
         # several scoped words
-        alternative_regex1 = re.compile(r'<(.*?)> \[=\? .*?\]')
-        clean = alternative_regex1.sub(r'\1', utterance)
+        clean = _alternative_regex1.sub(r'\1', utterance)
         # one scoped word
-        alternative_regex2 = re.compile(r'(\S+) \[=\? .*?\]')
-        return alternative_regex2.sub(r'\1', clean)
+        return _alternative_regex2.sub(r'\1', clean)
 
     def get_actual_utterance(self):
         """Get the actual form of the utterance.
@@ -70,9 +75,8 @@ class InuktitutReader(CHATReader):
         Yields:
             tuple: The next POS tag, segment and gloss in the word.
         """
-        morpheme_regex = re.compile(r'(.*)\|(.*?)\^(.*)')
         for morpheme in word.split('+'):
-            match = morpheme_regex.search(morpheme)
+            match = _morpheme_regex.search(morpheme)
             if match:
                 yield match.group(1), match.group(2), match.group(3)
             else:
@@ -7,8 +7,15 @@ from acqdiv.parsers.corpora.main.\
     import JapaneseMiiProGloss2SegmentMapper as Mp
 
 
+_morpheme_regex = re.compile(r'[^#]+#'
+                             r'|[^\-]+'
+                             r'|[\-][^\-]+')
+
+
 class JapaneseMiiProReader(CHATReader):
 
+    __slots__ = ()
+
     @classmethod
     def _is_target_child(cls, pos, role):
         if role == 'Target_Child':
@@ -64,10 +71,6 @@ class JapaneseMiiProReader(CHATReader):
         Returns:
             tuple: (segment, gloss, pos).
         """
-        morpheme_regex = re.compile(r'[^#]+#'
-                                    r'|[^\-]+'
-                                    r'|[\-][^\-]+')
-
         # get stem gloss and remove it from morpheme word
         match = re.search(r'(.+)=(\S+)$', morph_word)
         if match:
@@ -91,7 +94,7 @@ class JapaneseMiiProReader(CHATReader):
         for word_group in word_groups:
 
             # iter morphemes
-            for match in morpheme_regex.finditer(word_group):
+            for match in _morpheme_regex.finditer(word_group):
                 morpheme = match.group()
 
                 # prefix
@@ -6,8 +6,15 @@ from acqdiv.parsers.corpora.main.japanese_miyata\
     import JapaneseMiyataGloss2SegmentMapper as Mp
 
 
+_morpheme_regex = re.compile(r'[^#]+#'
+                             r'|[^\-]+'
+                             r'|[\-][^\-]+')
+
+
 class JapaneseMiyataReader(CHATReader):
 
+    __slots__ = ()
+
     @staticmethod
     def get_word_language(word):
         if word.endswith('@s:eng'):
@@ -47,10 +54,6 @@ class JapaneseMiyataReader(CHATReader):
         Returns:
             tuple: (segment, gloss, pos).
         """
-        morpheme_regex = re.compile(r'[^#]+#'
-                                    r'|[^\-]+'
-                                    r'|[\-][^\-]+')
-
         # get stem gloss and remove it from morpheme word
         match = re.search(r'(.+)=(\S+)$', morph_word)
         if match:
@@ -83,7 +86,7 @@ class JapaneseMiyataReader(CHATReader):
         for word_group in word_groups:
 
             # iter morphemes
-            for match in morpheme_regex.finditer(word_group):
+            for match in _morpheme_regex.finditer(word_group):
                 morpheme = match.group()
 
                 # prefix
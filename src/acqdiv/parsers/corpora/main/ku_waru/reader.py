@@ -3,8 +3,14 @@ import re
 from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 
+_word_boundary = re.compile(r'(?<![\-=\s])\s+(?![\-=\s]|\(\S+\))')
+_morpheme_boundary = re.compile(r'\s+(?!\s|\(\S+\))')
+
+
 class KuWaruReader(ToolboxReader):
 
+    __slots__ = ()
+
     @classmethod
     def get_speaker_label(cls, rec):
         return rec.get('ELANParticipant', '')
@@ -60,10 +66,8 @@ class KuWaruReader(ToolboxReader):
         Enhancement of the super parser: Keep word in parentheses together
         with the preceding word. Example: v  (eV) -v:FUT
         """
-        word_boundary = re.compile(r'(?<![\-=\s])\s+(?![\-=\s]|\(\S+\))')
-
         if pos_tier:
-            return re.split(word_boundary, pos_tier)
+            return _word_boundary.split(pos_tier)
         else:
             return []
 
@@ -74,10 +78,8 @@ class KuWaruReader(ToolboxReader):
         Enhancement of the super parser: Keep morpheme in parentheses together
         with the preceding morpheme. Example: v  (eV) -v:PROG
         """
-        morpheme_boundary = re.compile(r'\s+(?!\s|\(\S+\))')
-
         if pos_word:
-            return re.split(morpheme_boundary, pos_word)
+            return _morpheme_boundary.split(pos_word)
         else:
             return []
 
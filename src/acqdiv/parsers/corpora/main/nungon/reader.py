@@ -5,6 +5,8 @@ from acqdiv.parsers.chat.readers.reader import CHATReader
 
 class NungonReader(CHATReader):
 
+    __slots__ = ()
+
     # ---------- morphology tier ----------
 
     def get_seg_tier(self):
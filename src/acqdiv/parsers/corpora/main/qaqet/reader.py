@@ -3,6 +3,8 @@ from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 class QaqetReader(ToolboxReader):
 
+    __slots__ = ()
+
     @classmethod
     def get_addressee(cls, rec):
         add = rec.get('addr', '')
@@ -5,6 +5,8 @@ from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 class RussianReader(ToolboxReader):
 
+    __slots__ = ()
+
     @classmethod
     def get_actual_utterance(cls, rec):
         return rec.get('text', '')
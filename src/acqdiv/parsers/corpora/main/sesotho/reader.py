@@ -14,6 +14,8 @@ class SesothoReader(CHATReader):
     words and those to the utterance.
     """
 
+    __slots__ = ('_passed_stem',)
+
     def __init__(self, session_file):
         super().__init__(session_file)
         self._passed_stem = False
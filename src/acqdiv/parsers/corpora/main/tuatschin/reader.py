@@ -3,6 +3,8 @@ from acqdiv.parsers.toolbox.readers.reader import ToolboxReader
 
 class TuatschinReader(ToolboxReader):
 
+    __slots__ = ()
+
     @staticmethod
     def get_rec_separator():
         return br'\\u_id'
@@ -5,8 +5,14 @@ from acqdiv.parsers.corpora.main.turkish.gloss2segment_mapper \
     import TurkishGloss2SegmentMapper as Mp
 
 
+_start_time_regex = re.compile(r'([\d:]+)')
+_end_time_regex = re.compile(r'-([\d:]+)')
+
+
 class TurkishReader(CHATReader):
 
+    __slots__ = ()
+
     def get_start_time(self):
         """Get the start time.
 
@@ -16,8 +22,7 @@ class TurkishReader(CHATReader):
         if not time:
             return ''
         else:
-            time_regex = re.compile(r'([\d:]+)')
-            return time_regex.search(time).group()
+            return _start_time_regex.search(time).group()
 
     def get_end_time(self):
         """Get the end time.
@@ -28,8 +33,7 @@ class TurkishReader(CHATReader):
         if not time:
             return ''
         else:
-            time_regex = re.compile(r'-([\d:]+)')
-            match = time_regex.search(time)
+            match = _end_time_regex.search(time)
             if match:
                 return match.group(1)
             else:
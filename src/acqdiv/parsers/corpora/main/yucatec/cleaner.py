@@ -8,6 +8,9 @@ from acqdiv.parsers.corpora.main.yucatec.gloss_mapper \
 from acqdiv.parsers.corpora.main.yucatec.pos_mapper \
     import YucatecPOSMapper
 
+_double_hashes_regex = re.compile(r'(^| )##( |$)')
+_faulty_hyphen_regex = re.compile(r'(:[A-Z0-9]+)-(?=[a-záéíóúʔ]+)')
+
 
 class YucatecCleaner(CHATCleaner):
 
@@ -29,7 +32,7 @@ class YucatecCleaner(CHATCleaner):
     @classmethod
     def remove_double_hashes(cls, morph_tier):
         """Remove ## from the morphology tier."""
-        morph_tier = re.sub(r'(^| )##( |$)', r'\1\2', morph_tier)
+        morph_tier = _double_hashes_regex.sub(r'\1\2', morph_tier)
         return CHATUtteranceCleaner.remove_redundant_whitespaces(morph_tier)
 
     @classmethod
@@ -48,7 +51,7 @@ class YucatecCleaner(CHATCleaner):
 
         It is only attested in suffixes, not in prefixes.
         """
-        return re.sub(r'(:[A-Z0-9]+)-(?=[a-záéíóúʔ]+)', r'\1|', morpheme_word)
+        return _faulty_hyphen_regex.sub(r'\1|', morpheme_word)
 
     @staticmethod
     def remove_colon(morpheme_word):
@@ -3,8 +3,16 @@ import re
 from acqdiv.parsers.chat.readers.reader import CHATReader
 
 
+_morph_regex = re.compile(
+    r'(?P<prefixes>.*#)?'
+    r'((?P<stemleft>[0-9A-Z.:]+)\|-?)?(?P<stemright>[^:\-]+)'
+    r'(?P<suffixes>[:\-].+)?')
+
+
 class YucatecReader(CHATReader):
 
+    __slots__ = ()
+
     @staticmethod
     def get_utterance_words(utterance):
         """Get utterance words.
@@ -79,12 +87,7 @@ class YucatecReader(CHATReader):
                 yield seg, gloss, pos
         # fully or partially structured word
         else:
-            morph_regex = re.compile(
-                r'(?P<prefixes>.*#)?'
-                r'((?P<stemleft>[0-9A-Z.:]+)\|-?)?(?P<stemright>[^:\-]+)'
-                r'(?P<suffixes>[:\-].+)?')
-
-            match = morph_regex.fullmatch(word)
+            match = _morph_regex.fullmatch(word)
 
             # ----- prefixes -----
 
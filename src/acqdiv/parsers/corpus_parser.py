@@ -1,7 +1,12 @@
 """Abstract class for corpus parsing."""
 
 import glob
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 
 from tqdm import tqdm
 
@@ -10,18 +15,57 @@ from acqdiv.util.uniquespeaker import set_unique_speakers
 from acqdiv.util.session_duration import extract_duration
 
 
+def _parse_sessions(corpus_parser_class, cfg, session_paths):
+    """Parse a chunk of sessions in a worker process.
+
+    Args:
+        corpus_parser_class (type): The corpus parser class.
+        cfg (dict): Corpus configuration data.
+        session_paths (List[str]): Paths to the session files.
+
+    Returns:
+        List[Optional[acqdiv.model.session.Session]]: The sessions. A
+            session is `None` if the corpus parser does not provide a
+            session parser for its path.
+    """
+    corpus_parser = corpus_parser_class(cfg, disable_pbar=True)
+    sessions = []
+
+    for session_path in session_paths:
+        session_parser = corpus_parser.get_session_parser(session_path)
+
+        if session_parser is None:
+            sessions.append(None)
+        else:
+            sessions.append(session_parser.parse())
+
+    return sessions
+
+
 class CorpusParser(ABC):
     """Methods for constructing a corpus instance."""
 
-    def __init__(self, cfg, disable_pbar=False):
+    def __init__(self, cfg, disable_pbar=False, workers=1, chunksize=8):
         """Initialize config.
 
         Args:
             cfg (dict): Corpus configuration data.
             disable_pbar (bool): Whether the progressbar should be disabled.
+            workers (Optional[int]): Number of processes parsing sessions,
+                at least 1. `None` uses as many processes as there are CPUs.
+            chunksize (int): Number of sessions sent to a process at once.
+
+        Raises:
+            ValueError: If `workers` is smaller than 1.
         """
+        if workers is not None and workers < 1:
+            raise ValueError(
+                'workers must be None or at least 1, got %s' % workers)
+
         self.cfg = cfg
         self.disable_pbar = disable_pbar
+        self.workers = workers
+        self.chunksize = chunksize
         tqdm.monitor_interval = 0
         self.corpus = Corpus()
 
@@ -51,21 +95,22 @@ class CorpusParser(ABC):
     def iter_sessions(self):
         """Iter the sessions of the corpus.
 
+        Sessions are parsed in `self.workers` processes if more than one
+        worker is requested. They are yielded in the same order in either
+        case.
+
         Yields:
-            acqdiv.parsers.SessionParser: The session parser.
+            acqdiv.model.session.Session: The session.
         """
         session_paths = sorted(glob.glob(self.cfg['sessions']))
 
         with tqdm(session_paths, disable=self.disable_pbar) as pbar:
 
-            for session_path in pbar:
+            for session_path, session in zip(
+                    pbar, self.iter_parsed_sessions(session_paths)):
                 pbar.set_description(session_path)
 
-                session_parser = self.get_session_parser(session_path)
-
-                if session_parser is not None:
-
-                    session = session_parser.parse()
+                if session is not None:
 
                     # set unique speakers
                     set_unique_speakers(self.corpus.corpus, session.speakers)
@@ -80,3 +125,43 @@ class CorpusParser(ABC):
                             print("\t", session_path)
 
                         yield session
+
+    def iter_parsed_sessions(self, session_paths):
+        """Parse the sessions, in parallel if several workers are set.
+
+        Args:
+            session_paths (List[str]): Paths to the session files.
+
+        Yields:
+            Optional[acqdiv.model.session.Session]: The session or `None` if
+                there is no session parser for the path.
+        """
+        if self.workers == 1:
+            for session_path in session_paths:
+                session_parser = self.get_session_parser(session_path)
+
+                if session_parser is None:
+                    yield None
+                else:
+                    yield session_parser.parse()
+        else:
+            parse_sessions = partial(_parse_sessions, type(self), self.cfg)
+            workers = (os.cpu_count() if self.workers is None
+                       else self.workers)
+            chunks = (session_paths[i:i + self.chunksize]
+                      for i in range(0, len(session_paths), self.chunksize))
+
+            # keep at most one chunk per worker in flight so that parsed
+            # sessions do not pile up while the caller consumes them
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = deque(executor.submit(parse_sessions, chunk)
+                                for chunk in islice(chunks, workers))
+
+                while futures:
+                    sessions = futures.popleft().result()
+
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        futures.append(executor.submit(parse_sessions, chunk))
+
+                    yield from sessions
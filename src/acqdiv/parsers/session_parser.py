@@ -13,3 +13,25 @@ class SessionParser(ABC):
             acqdiv.model.session.Session: The Session instance.
         """
         pass
+
+    @staticmethod
+    def get_speakers_by_label(speakers):
+        """Index the speakers by their label.
+
+        If several speakers share the same label, the first one is kept.
+
+        Args:
+            speakers (List[acqdiv.model.speaker.Speaker]): The speakers.
+
+        Returns:
+            Dict[str, acqdiv.model.speaker.Speaker]: The speakers by label.
+        """
+        speakers_by_label = {}
+        for speaker in speakers:
+            speakers_by_label.setdefault(speaker.code, speaker)
+
+        return speakers_by_label
+
+    def _get_speaker(self, label):
+        """Get the speaker with the label or `None` if there is none."""
+        return self.speakers_by_label.get(label)
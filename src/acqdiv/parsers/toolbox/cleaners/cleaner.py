@@ -4,13 +4,16 @@ from acqdiv.parsers.toolbox.cleaners.morpheme_cleaner \
     import ToolboxMorphemeCleaner
 from acqdiv.util.timestamp import unify_timestamp
 
+_whitespace_regex = re.compile(r'\s+')
+_unknown_regex = re.compile(r'xxx?|www|\*{3}')
+
 
 class ToolboxCleaner:
 
     @staticmethod
     def remove_redundant_whitespaces(string):
         """Remove redundant whitespaces."""
-        string = re.sub(r'\s+', ' ', string)
+        string = _whitespace_regex.sub(' ', string)
         string = string.strip()
         return string
 
@@ -22,7 +25,7 @@ class ToolboxCleaner:
 
     @staticmethod
     def unify_unknown(utterance):
-        return re.sub('xxx?|www|\*{3}', '???', utterance)
+        return _unknown_regex.sub('???', utterance)
 
     @classmethod
     def clean_utterance(cls, utterance):
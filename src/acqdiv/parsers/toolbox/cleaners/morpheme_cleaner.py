@@ -1,5 +1,7 @@
 import re
 
+_unknown_regex = re.compile(r'\*{3}|\?{3}')
+
 
 class ToolboxMorphemeCleaner:
 
@@ -24,4 +26,4 @@ class ToolboxMorphemeCleaner:
 
         Unknown values: ***, ???
         """
-        return re.sub(r'\*{3}|\?{3}', '', morpheme)
+        return _unknown_regex.sub('', morpheme)
@@ -55,6 +55,8 @@ class ToolboxParser(SessionParser):
         # get cleaner
         self.cleaner = self.get_cleaner()
 
+        self.speakers_by_label = {}
+
     def parse(self):
         """Get the session instance.
 
@@ -63,6 +65,8 @@ class ToolboxParser(SessionParser):
         """
         self.add_session_metadata()
         self.add_speakers()
+        self.speakers_by_label = self.get_speakers_by_label(
+            self.session.speakers)
         self.add_records()
 
         return self.session
@@ -145,14 +149,6 @@ class ToolboxParser(SessionParser):
 
         align_words_morphemes(utt)
 
-    @staticmethod
-    def _get_speaker(label, speakers):
-        for speaker in speakers:
-            if speaker.code == label:
-                return speaker
-
-        return None
-
     def add_utterance(self, rec):
         """Add the utterance to the Session instance.
 
@@ -163,11 +159,9 @@ class ToolboxParser(SessionParser):
         self.session.utterances.append(utt)
 
         speaker_label = self.record_reader.get_speaker_label(rec)
-        utt.speaker = self._get_speaker(
-            speaker_label, self.session.speakers)
+        utt.speaker = self._get_speaker(speaker_label)
         addressee_label = self.record_reader.get_addressee(rec)
-        utt.addressee = self._get_speaker(
-            addressee_label, self.session.speakers)
+        utt.addressee = self._get_speaker(addressee_label)
         utt.utterance_raw = self.record_reader.get_actual_utterance(rec)
         utt.utterance = self.cleaner.clean_utterance(utt.utterance_raw)
         utt.sentence_type = self.record_reader.get_sentence_type(rec)
@@ -31,7 +31,7 @@ class ToolboxAgeUpdater:
             speaker.age = ages[0]
             speaker.age_in_days = ages[1]
 
-        if not speaker.age and re.fullmatch(cls.age_pattern, speaker.age_raw):
+        if not speaker.age and cls.age_pattern.fullmatch(speaker.age_raw):
             speaker.age = speaker.age_raw
             speaker.age_in_days = get_age_in_days(speaker.age)
 
@@ -1,9 +1,14 @@
 import re
 
 
+_word_boundary = re.compile(r'(?<![\-=\s])\s+(?![\-=\s])')
+
+
 class ToolboxReader(object):
     """Methods for reading Toolbox."""
 
+    __slots__ = ()
+
     # ---------- record ----------
 
     @classmethod
@@ -123,10 +128,8 @@ class ToolboxReader(object):
 
     @classmethod
     def get_morpheme_words(cls, morpheme_tier):
-        _word_boundary = re.compile(r'(?<![\-=\s])\s+(?![\-=\s])')
-
         if morpheme_tier:
-            return re.split(_word_boundary, morpheme_tier)
+            return _word_boundary.split(morpheme_tier)
         else:
             return []
 
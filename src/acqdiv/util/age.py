@@ -1,7 +1,33 @@
 import re
 from datetime import datetime
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 
+_age_regex = re.compile(r"(\d*);(\d*).(\d*)")
+
+# number of hyphens mapped to the date format and its accuracy flag
+_birth_date_formats = {0: ('%Y', 1), 2: ('%Y-%m-%d', 0)}
+_session_date_formats = {0: ('%Y', 1), 1: ('%Y-%m', 2), 2: ('%Y-%m-%d', 0)}
+
+
+def _parse_date(date, formats):
+    """Parse the date with the format matching its number of hyphens.
+
+    Args:
+        date (str): The date.
+        formats (Dict[int, Tuple[str, int]]): Number of hyphens mapped to
+            the format and accuracy flag.
+
+    Returns:
+        Tuple[datetime, int]: The date and the accuracy flag or
+            (None, None) if the date cannot be parsed.
+    """
+    try:
+        fmt, accuracy = formats[date.count('-')]
+        return datetime.strptime(date, fmt), accuracy
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None, None
+
 
 def get_age_from_birth_date_session_date(birthdate, sessiondate):
     """Calculate the age from the birth date and the session date.
@@ -21,29 +47,13 @@ def get_age_from_birth_date_session_date(birthdate, sessiondate):
         BirthdateError: the speaker's birth date is None or invalid
         SessionDateError: the session recording date is None or invalid
     """
-    acc_flag_bd = 0
-    acc_flag_sd = 0
-    try:
-        d1 = datetime.strptime(birthdate, "%Y-%m-%d")
-    except:
-        try:
-            d1 = datetime.strptime(birthdate, "%Y")
-            acc_flag_bd = 1
-        except Exception as bde:
-            return ['', '']
+    d1, acc_flag_bd = _parse_date(birthdate, _birth_date_formats)
+    if d1 is None:
+        return ['', '']
 
-    try:
-        d2 = datetime.strptime(sessiondate, "%Y-%m-%d")
-    except:
-        try:
-            d2 = datetime.strptime(sessiondate, "%Y")
-            acc_flag_sd = 1
-        except:
-            try:
-                d2 = datetime.strptime(sessiondate, "%Y-%m")
-                acc_flag_sd = 2
-            except Exception as sde:
-                return ['', '']
+    d2, acc_flag_sd = _parse_date(sessiondate, _session_date_formats)
+    if d2 is None:
+        return ['', '']
 
     diff = relativedelta(d2, d1)
     diff_days = d2 - d1
@@ -61,6 +71,7 @@ def get_age_from_birth_date_session_date(birthdate, sessiondate):
              age_days if age_days != 0 else None])
 
 
+@lru_cache(maxsize=8192)
 def get_age_in_days(age):
     """Convert the age to days.
 
@@ -73,7 +84,7 @@ def get_age_in_days(age):
     Returns:
         int: The age in days.
     """
-    age = re.match(r"(\d*);(\d*).(\d*)", age)
+    age = _age_regex.match(age)
     if age:
         years = int(age.group(1))
         months = int(age.group(2))
@@ -9,14 +9,15 @@ def align_words_morphemes(utt):
     Args:
         utt (acqdiv.model.utterance.Utterance): The utterance.
     """
-    link_to_word = len(utt.morphemes) == len(utt.words)
-    for i, mword in enumerate(utt.morphemes):
+    if len(utt.morphemes) != len(utt.words):
+        return
+
+    for word, mword in zip(utt.words, utt.morphemes):
         for morpheme in mword:
-            if link_to_word:
-                morpheme.word = utt.words[i]
-                if morpheme.pos not in ['sfx', 'pfx']:
-                    utt.words[i].pos = morpheme.pos
-                    utt.words[i].pos_ud = morpheme.pos_ud
+            morpheme.word = word
+            if morpheme.pos not in ('sfx', 'pfx'):
+                word.pos = morpheme.pos
+                word.pos_ud = morpheme.pos_ud
 
 
 def fix_misalignments(entities):
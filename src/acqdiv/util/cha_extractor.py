@@ -3,8 +3,10 @@ from shutil import copyfile
 
 os.mkdir('cha')
 
-for folder in os.listdir('.'):
-    if os.path.isdir(folder) and folder != 'cha':
-        for cha_file in os.listdir(folder):
-            cha_path = os.path.join(folder, cha_file)
-            copyfile(cha_path, os.path.join('cha', folder + '_' + cha_file))
+with os.scandir('.') as folders:
+    for folder in folders:
+        if folder.is_dir() and folder.name != 'cha':
+            with os.scandir(folder.path) as cha_files:
+                for cha_file in cha_files:
+                    copyfile(cha_file.path, os.path.join(
+                        'cha', folder.name + '_' + cha_file.name))
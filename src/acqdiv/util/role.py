@@ -16,6 +16,10 @@ class RoleMapper:
     """Class for mapping various roles to and from other fields."""
 
     roles = get_roles()
+    # plain dicts, section proxies interpolate the value on every lookup
+    role_mapping = dict(roles['role_mapping'])
+    role2gender = dict(roles['role2gender'])
+    role2macrorole = dict(roles['role2macrorole'])
 
     def __init__(self, path_label2macro_role=None):
         if path_label2macro_role:
@@ -26,23 +30,22 @@ class RoleMapper:
     @classmethod
     def role_raw2role(cls, role_raw):
         """Map the original role to the unified role."""
-        if role_raw in cls.roles['role_mapping']:
-            role = cls.roles['role_mapping'][role_raw]
-            # all unknown's and none's listed in the ini become NULL
-            if role != 'Unknown' and role != 'None':
-                return role
+        role = cls.role_mapping.get(role_raw, '')
+        # all unknown's and none's listed in the ini become NULL
+        if role == 'Unknown' or role == 'None':
+            return ''
 
-        return ''
+        return role
 
     @classmethod
     def role_raw2gender(cls, role_raw):
         """Map the original role to a gender."""
-        return cls.roles['role2gender'].get(role_raw, '')
+        return cls.role2gender.get(role_raw, '')
     
     @classmethod
     def role_raw2macrorole(cls, role_raw):
         """Map the original role to the macro role."""
-        return cls.roles['role2macrorole'].get(role_raw, '')
+        return cls.role2macrorole.get(role_raw, '')
 
     @classmethod
     def age_in_days2macrorole(cls, age_in_days):
@@ -1,6 +1,10 @@
 import re
+from functools import lru_cache
 
+_timestamp_regex = re.compile(r'(\d+):(\d+):(\d+)\.?(\d+)?')
 
+
+@lru_cache(maxsize=8192)
 def unify_timestamp(timestamp_raw):
     """Unify the time stamp.
 
@@ -16,25 +20,15 @@ def unify_timestamp(timestamp_raw):
     """
     if not timestamp_raw:
         return ''
-    times = re.match(r'(\d+):(\d+):(\d+)\.?(\d+)?', timestamp_raw)
+    times = _timestamp_regex.match(timestamp_raw)
     if times:
-        fields = times.lastindex
-        if fields == 4:
-            seconds = int(
-                        times.group(1)) * 3600 \
-                      + int(times.group(2)) * 60 \
-                      + int(times.group(3))
+        seconds = int(times.group(1)) * 3600 \
+                  + int(times.group(2)) * 60 \
+                  + int(times.group(3))
+        if times.lastindex == 4:
             msecs = times.group(4)
             return "{0}.{1}".format(seconds, msecs)
-        elif fields == 3:
-            times = re.match(r'(\d+):(\d+):(\d+)', timestamp_raw)
-            if times:
-                seconds = int(
-                            times.group(1)) * 3600 \
-                          + int(times.group(2)) * 60 \
-                          + int(times.group(3))
-                return "{0}.000".format(seconds)
         else:
-            return ''
+            return "{0}.000".format(seconds)
     else:
         return timestamp_raw
@@ -11,6 +11,10 @@ from sqlalchemy.orm import sessionmaker
 
 from acqdiv.util.path import get_path_of_most_recent_database
 
+_pattern_speaker_ages = re.compile(
+    r'^(\d\d?(;(0?[0-9]|1[01]).([012]?[0-9]|30))?)$')
+_pattern_null_like = re.compile(r'[\s*?#wxy0]*')
+
 
 class IntegrityTest(unittest.TestCase):
     """Integrity tests on the production database."""
@@ -20,8 +24,8 @@ class IntegrityTest(unittest.TestCase):
     session = None
     meta = None
     cfg = None
-    f_no_nulls = None
-    f_proportions = None
+    tables_no_nulls = None
+    tables_proportions = None
 
     @classmethod
     def setUpClass(cls):
@@ -41,19 +45,16 @@ class IntegrityTest(unittest.TestCase):
 
         # Load list of tables from csv file and
         # check that the specified table and their columns contain no NULLs
-        cls.f_no_nulls = open(os.path.join(
-                                cls.cwd_path,
-                                "resources/tables-no-nulls-allowed.csv"), "r")
-        cls.reader_tables_no_nulls = csv.reader(cls.f_no_nulls)
-        next(cls.reader_tables_no_nulls)  # Skip the header
+        # (read into lists, so that every test sees all rows)
+        with open(os.path.join(
+                cls.cwd_path, "resources/tables-no-nulls-allowed.csv")) as f:
+            cls.tables_no_nulls = list(csv.reader(f))[1:]  # Skip the header
 
         # Load list of tables from csv file and check for coverage proportion.
-        cls.f_proportions = open(os.path.join(
-                                    cls.cwd_path,
-                                    "resources/tables-proportions-filled.csv"),
-                                 "r")
-        cls.reader_proportion_nulls = csv.reader(cls.f_proportions)
-        next(cls.reader_proportion_nulls)  # Skip the header
+        with open(os.path.join(
+                cls.cwd_path,
+                "resources/tables-proportions-filled.csv")) as f:
+            cls.tables_proportions = list(csv.reader(f))[1:]  # Skip the header
 
         # Create views
         view_path = os.path.join(cls.cwd_path, 'resources/create_views.sql')
@@ -65,8 +66,6 @@ class IntegrityTest(unittest.TestCase):
     def tearDownClass(cls):
         """Tear down the test resources."""
         cls.session.close()
-        cls.f_no_nulls.close()
-        cls.f_proportions.close()
 
         # Delete views
         view_path = os.path.join(cls.cwd_path, 'resources/drop_views.sql')
@@ -76,18 +75,18 @@ class IntegrityTest(unittest.TestCase):
     def test_columns_for_all_null(self):
         """Any column with all NULL rows should throw an error."""
         for table in self.meta.tables.values():
-            for column in table.c:
-                if str(column) not in [
-                        'morphemes.lemma_id',
-                        'morphemes.warning',
-                        'utterances.warning',
-                        'words.warning'
-                        ]:
-                    self._column_contains_all_nulls(table, column)
+            columns = [column for column in table.c
+                       if str(column) not in [
+                           'morphemes.lemma_id',
+                           'morphemes.warning',
+                           'utterances.warning',
+                           'words.warning'
+                       ]]
+            self._columns_contain_all_nulls(table, columns)
 
     def test_columns_for_any_null(self):
         """ User specified columns should never have a NULL row. """
-        for row in self.reader_tables_no_nulls:
+        for row in self.tables_no_nulls:
             table = row[0]
             column = row[1]
             self._column_contains_null(table, column)
@@ -95,15 +94,19 @@ class IntegrityTest(unittest.TestCase):
     def test_counts(self):
         """Use the fixture database gold counts and check production DB."""
         mismatched_counts = []
+        # one query per table, shared by all corpora
+        counts_per_table = {}
         for section in self.cfg:
             if section == "default":
                 continue
             for option in self.cfg[section]:
                 count = int(self.cfg[section][option])
-                res = self.session.execute(
-                    "select count(*) from %s where corpus = '%s'"
-                    % (option, section))
-                actual = res.fetchone()[0]
+                if option not in counts_per_table:
+                    res = self.session.execute(
+                        "select corpus, count(*) from %s group by corpus"
+                        % option)
+                    counts_per_table[option] = dict(res.fetchall())
+                actual = counts_per_table[option].get(section, 0)
 
                 if actual != count:
                     mismatched_counts.append((section, option, count, actual))
@@ -115,7 +118,7 @@ class IntegrityTest(unittest.TestCase):
     def test_sentence_type(self):
         """ Check sentence types in database vs whitelist. """
         query = "select sentence_type from utterances group by sentence_type"
-        sentence_types = [
+        sentence_types = {
             None,
             # ACQDIV sentence types
             "default",
@@ -133,28 +136,27 @@ class IntegrityTest(unittest.TestCase):
             'self-interrupted question',
             'quotation follows',
             "quotation precedes",
-        ]
+        }
 
         self._in_whitelist(query, sentence_types)
 
     def test_gender(self):
         """ Check genders in database vs whitelist. """
         query = "select gender from uniquespeakers group by gender"
-        gender = ["Female", "Male", None]
+        gender = {"Female", "Male", None}
         self._in_whitelist(query, gender)
 
     def test_pos(self):
         """ Check pos in database vs whitelist. """
         query = "select pos from morphemes group by pos"
 
-        poses = [
+        poses = {
             "ADJ", "ADV", "ART", "AUX", "CLF", "CONJ", "IDEOPH",
             "INTJ", "N", "NUM", "PVB", "pfx", "POST",
-            "PREP", "PRODEM", "PTCL", "QUANT", "sfx", "stem", "V", "???"]
+            "PREP", "PRODEM", "PTCL", "QUANT", "sfx", "stem", "V", "???"}
 
         res = self.session.execute(query)
-        rows = res.fetchall()
-        for row in rows:
+        for row in res:
             pos = row[0]
 
             if pos is not None:
@@ -167,14 +169,13 @@ class IntegrityTest(unittest.TestCase):
     def test_pos_ud(self):
         """ Check UD pos (on word level) in database vs whitelist. """
         query = "select pos_ud from words group by pos_ud"
-        poses = [
+        poses = {
             None, "ADJ", "ADP", "ADV", "AUX", "CCONJ", "DET", "INTJ", "NOUN",
             "NUM", "PART", "PRON", "PROPN", "PUNCT", "SCONJ", "SYM", "VERB",
-            "X"]
+            "X"}
 
         res = self.session.execute(query)
-        rows = res.fetchall()
-        for row in rows:
+        for row in res:
             pos = row[0]
 
             if pos is not None:
@@ -187,7 +188,7 @@ class IntegrityTest(unittest.TestCase):
     def test_role(self):
         """ Check roles in database vs whitelist. """
         query = "select role from speakers group by role"
-        roles = [
+        roles = {
             "Adult",
             "Aunt",
             "Babysitter",
@@ -225,20 +226,18 @@ class IntegrityTest(unittest.TestCase):
             "Uncle",
             "Visitor",
             None
-        ]
+        }
         self._in_whitelist(query, roles)
 
     def test_macrorole(self):
         """ Check macroles in database vs whitelist. """
         query = "select macrorole from speakers group by macrorole"
-        macroroles = ["Adult", "Child", "Target_Child", None]
+        macroroles = {"Adult", "Child", "Target_Child", None}
         self._in_whitelist(query, macroroles)
 
     def test_speaker_ages(self):
         # should be able to check it in various db columns
         query = "select age from speakers group by age"
-        _pattern_speaker_ages = re.compile(
-            r'^(\d\d?(;(0?[0-9]|1[01]).([012]?[0-9]|30))?)$')
         self._in_string(query, _pattern_speaker_ages)
 
     def test_date_sessions(self):
@@ -254,7 +253,7 @@ class IntegrityTest(unittest.TestCase):
     def test_language_per_morpheme(self):
         """ Check whether the language mapping is working as intended """
         query = "SELECT DISTINCT language FROM morphemes"
-        langs = [
+        langs = {
             "Arabic",
             "Bantawa",
             "Chintang",
@@ -280,7 +279,7 @@ class IntegrityTest(unittest.TestCase):
             "Nungon",
             "Tok Pisin",
             None
-        ]
+        }
         self._in_whitelist(query, langs)
 
     def test_more_target_children_per_session(self):
@@ -314,19 +313,24 @@ class IntegrityTest(unittest.TestCase):
         result = res.fetchone()[0]
         self.assertEqual(result, 0, msg='%s %s' % (res, query))
 
-    def _column_contains_all_nulls(self, table, column):
-        """ Test if rows in a column are all NULL. """
-        query = "select count(*) from %s where %s is not NULL" \
-                % (table, column)
+    def _columns_contain_all_nulls(self, table, columns):
+        """ Test if rows in any of the columns are all NULL.
+
+        The non-NULL values of all columns are counted in one query.
+        """
+        if not columns:
+            return
+
+        query = "select %s from %s" % (
+            ', '.join('count(%s)' % column for column in columns), table)
         res = self.session.execute(query)
-        result = res.fetchone()[0]
-        self.assertGreater(result, 0, msg='%s %s' % (res, query))
+        for column, result in zip(columns, res.fetchone()):
+            self.assertGreater(result, 0, msg='%s %s' % (column, query))
 
     def _is_valid_date(self, query):
         """Check if input string is NULL or adheres to dateutils format."""
         res = self.session.execute(query)
-        rows = res.fetchall()
-        for row in rows:
+        for row in res:
             value = row[0]
             is_valid = False
             if value is None or self._is_date(value):
@@ -344,21 +348,14 @@ class IntegrityTest(unittest.TestCase):
         except ValueError:
             return False
 
-    def _is_match(self, string, pattern):
-        """ Check if regex valid against string. """
-        if pattern.search(string) is None:
-            return False
-        else:
-            return True
-
     def _validate_string(self, query, pattern, is_string):
         """Validate if unique strings in a column conform to some regex."""
         res = self.session.execute(query)
-        rows = res.fetchall()
-        for row in rows:
+        search = pattern.search
+        for row in res:
             value = row[0]
             if value is not None:
-                is_valid = self._is_match(value, pattern)
+                is_valid = search(value) is not None
                 if is_string:
                     self.assertTrue(
                         is_valid, msg='%s %s (%s)' % (value, is_valid, query))
@@ -388,8 +385,7 @@ class IntegrityTest(unittest.TestCase):
         check that the result types are in the whitelist (or not).
         """
         res = self.session.execute(query)
-        rows = res.fetchall()
-        for row in rows:
+        for row in res:
             label = row[0]
             if is_whitelist:  # This is whitelist.
                 self.assertIn(
@@ -402,25 +398,33 @@ class IntegrityTest(unittest.TestCase):
                     filter_list,
                     msg='value found in (%s) is not permitted')
 
-    def compute_null_proportion(
-            self, query, corpus, table, column, expected, fails):
+    def count_non_null_values(self, table, column):
+        """Count the non-NULL and all values of a column per corpus.
+
+        Values only consisting of whitespace, `*`, `?`, `#`, `w`, `x`, `y` or
+        `0` are counted as NULL.
 
-        res = self.session.execute(query.format(
-                table=table, column=column, corpus=corpus))
+        Returns:
+            dict: Corpus mapped to (non-NULL count, total count).
+        """
+        query = "SELECT corpus, {column} FROM v{table}".format(
+            table=table, column=column)
 
-        result = res.fetchall()
+        counts = {}
+        for corpus, val in self.session.execute(query):
+            not_null_count, total = counts.get(corpus, (0, 0))
+            if (val is not None
+                    and not _pattern_null_like.fullmatch(str(val))):
+                not_null_count += 1
+            counts[corpus] = (not_null_count, total + 1)
 
-        if result:
-            not_null_count = 0
-            total = 0
+        return counts
 
-            for r in result:
-                val = r[0]
-                total += 1
-                if (val is not None
-                        and not re.fullmatch(r'[\s*?#wxy0]*', str(val))):
-                    not_null_count += 1
+    def compute_null_proportion(
+            self, counts, corpus, table, column, expected, fails):
 
+        if corpus in counts:
+            not_null_count, total = counts[corpus]
             actual = not_null_count / total
 
             t = (corpus, table, column, actual, expected)
@@ -435,32 +439,32 @@ class IntegrityTest(unittest.TestCase):
                    "Japanese_Miyata", "Japanese_MiiPro", "Russian",
                    "Sesotho", "Turkish", "Yucatec"]
 
-        query = """
-            SELECT {column}
-            FROM v{table}
-            WHERE corpus = '{corpus}'
-        """
-
         msg = 'Proportion of non-NULL values too low:'
 
         fails = []
 
-        # print('Computing proportions of non-nulls:')
+        # one query per column, shared by all its corpora
+        counts_per_column = {}
 
-        for row in self.reader_proportion_nulls:
+        for row in self.tables_proportions:
 
             table = row[0]
             column = row[1]
             corpus = row[2]
             expected = float(row[3])
 
+            if (table, column) not in counts_per_column:
+                counts_per_column[table, column] = \
+                    self.count_non_null_values(table, column)
+            counts = counts_per_column[table, column]
+
             if corpus == 'all':
                 for corpus in corpora:
                     self.compute_null_proportion(
-                        query, corpus, table, column, expected, fails)
+                        counts, corpus, table, column, expected, fails)
             else:
                 self.compute_null_proportion(
-                    query, corpus, table, column, expected, fails)
+                    counts, corpus, table, column, expected, fails)
 
         self.assertListEqual(fails, [], msg=msg+str(fails))
 
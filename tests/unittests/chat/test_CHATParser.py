@@ -25,6 +25,19 @@ class TestCHATParser(unittest.TestCase):
         actual_cleaner = CHATParser.get_cleaner()
         self.assertTrue(isinstance(actual_cleaner, CHATCleaner))
 
+    def test_get_speakers_by_label(self):
+        """Test get_speakers_by_label with a duplicate label. (CHATParser)"""
+        mem = Speaker()
+        mem.code = 'MEM'
+        chi = Speaker()
+        chi.code = 'CHI'
+        chi_duplicate = Speaker()
+        chi_duplicate.code = 'CHI'
+        actual_output = CHATParser.get_speakers_by_label(
+            [mem, chi, chi_duplicate])
+        desired_output = {'MEM': mem, 'CHI': chi}
+        self.assertEqual(actual_output, desired_output)
+
     def test_get_session_metadata(self):
         """Test get_session_metadata with TestCHATParser.cha. (CHATParser)"""
         session = (
@@ -5,6 +5,11 @@ from acqdiv.parsers.chat.readers.reader import CHATReader
 from acqdiv.parsers.chat.model.participant import Participant
 
 
+# @ID fields of MEM of test.cha
+_MEM_ID_FIELDS = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
+                  'Grandmother', '', '')
+
+
 class TestCHATReader(unittest.TestCase):
     """Class to test the CHATFileParser."""
 
@@ -88,6 +93,13 @@ class TestCHATReader(unittest.TestCase):
         desired_output = ('Participants', ptcs)
         self.assertEqual(actual_output, desired_output)
 
+    def test_get_metadata_field_colon_tab_in_content(self):
+        """Test get_metadata_field with a colon and tab in the content."""
+        actual_output = CHATFileParser.get_metadata_field(
+            '@Comment:\ttime:\t1:00:00')
+        desired_output = ('Comment', 'time:\t1:00:00')
+        self.assertEqual(actual_output, desired_output)
+
     # ---------- get_media_fields ----------
 
     def test_get_media_fields_two_fields(self):
@@ -158,6 +170,14 @@ class TestCHATReader(unittest.TestCase):
         desired_output = ptcs_list
         self.assertEqual(actual_output, desired_output)
 
+    def test_iter_participants_trailing_comma(self):
+        """Test iter_participants with a trailing comma."""
+        ptcs = 'MEM Mme_Manyili Grandmother , CHI Hlobohang Target_Child , '
+        actual_output = list(CHATFileParser.iter_participants(ptcs))
+        desired_output = ['MEM Mme_Manyili Grandmother',
+                          'CHI Hlobohang Target_Child']
+        self.assertEqual(actual_output, desired_output)
+
     # ---------- get_participant_fields ----------
 
     def test_get_participant_fields_one_field(self):
@@ -166,6 +186,12 @@ class TestCHATReader(unittest.TestCase):
         desired_output = ('MEM', '', '')
         self.assertEqual(actual_output, desired_output)
 
+    def test_get_participant_fields_empty_string(self):
+        """Test get_participant_fields for an empty string."""
+        actual_output = CHATFileParser.get_participant_fields('')
+        desired_output = ('', '', '')
+        self.assertEqual(actual_output, desired_output)
+
     def test_get_participant_fields_two_fields(self):
         """Test get_participant_fields for two field input."""
         actual_output = CHATFileParser.get_participant_fields('MEM Grandmother')
@@ -207,12 +233,19 @@ class TestCHATReader(unittest.TestCase):
                           '', 'Grandmother', '', '')
         self.assertEqual(actual_output, desired_output)
 
+    def test_get_id_fields_missing_fields(self):
+        """Test get_id_fields with missing trailing fields."""
+        id_fields = 'sme|Sesotho|MEM|'
+        actual_output = CHATFileParser.get_id_fields(id_fields)
+        desired_output = ('sme', 'Sesotho', 'MEM', '', '', '',
+                          '', '', '', '')
+        self.assertEqual(actual_output, desired_output)
+
     # ---------- get_id_language ----------
 
     def test_get_id_language(self):
         """Test get_id_language with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_language(id_fields)
         desired_output = 'sme'
         self.assertEqual(actual_output, desired_output)
@@ -221,8 +254,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_corpus(self):
         """Test get_id_corpus with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_corpus(id_fields)
         desired_output = 'Sesotho'
         self.assertEqual(actual_output, desired_output)
@@ -231,8 +263,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_code(self):
         """Test get_id_code with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_code(id_fields)
         desired_output = 'MEM'
         self.assertEqual(actual_output, desired_output)
@@ -241,8 +272,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_age(self):
         """Test get_id_age with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_age(id_fields)
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
@@ -251,8 +281,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_sex(self):
         """Test get_id_sex with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_sex(id_fields)
         desired_output = 'female'
         self.assertEqual(actual_output, desired_output)
@@ -261,8 +290,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_group(self):
         """Test get_id_group with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_group(id_fields)
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
@@ -271,8 +299,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_ses(self):
         """Test get_id_ses with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_ses(id_fields)
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
@@ -281,8 +308,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_role(self):
         """Test get_id_role with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_role(id_fields)
         desired_output = 'Grandmother'
         self.assertEqual(actual_output, desired_output)
@@ -291,8 +317,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_education(self):
         """Test get_id_education with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_education(id_fields)
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
@@ -301,8 +326,7 @@ class TestCHATReader(unittest.TestCase):
 
     def test_get_id_custom(self):
         """Test get_id_custom with id-fields of MEM of test.cha."""
-        id_fields = ('sme', 'Sesotho', 'MEM', '', 'female', '', '',
-                     'Grandmother', '', '')
+        id_fields = _MEM_ID_FIELDS
         actual_output = CHATFileParser.get_id_custom(id_fields)
         desired_output = ''
         self.assertEqual(actual_output, desired_output)
@@ -379,6 +403,16 @@ class TestCHATReader(unittest.TestCase):
         ]
         self.assertEqual(actual_output, desired_output)
 
+    def test_iter_records_many_records(self):
+        """Test iter_records for a session with many records."""
+        record = '*CHI:\tke eng ?\n%gls:\tke eng ?'
+        session = ('@UTF8\n@Begin\n'
+                   + '\n'.join(record for _ in range(20000))
+                   + '\n@End\n')
+        actual_output = list(CHATFileParser.iter_records(session))
+        desired_output = [record] * 20000
+        self.assertEqual(actual_output, desired_output)
+
     # ---------- get_mainline ----------
 
     def test_get_mainline_standard_case(self):
@@ -567,6 +601,20 @@ class TestCHATReader(unittest.TestCase):
         desired_output = ('eng', 'A new thing%')
         self.assertEqual(actual_output, desired_output)
 
+    def test_get_dependent_tier_additional_colon_tab(self):
+        """Test get_dependent_tier with a colon and tab in the content."""
+        dep_tier = '%com:\ttime:\t1:00:00'
+        actual_output = CHATFileParser.get_dependent_tier(dep_tier)
+        desired_output = ('com', 'time:\t1:00:00')
+        self.assertEqual(actual_output, desired_output)
+
+    def test_get_dependent_tier_colon_space(self):
+        """Test get_dependent_tier with a blank space after the colon."""
+        dep_tier = '%eng: A new thing'
+        actual_output = CHATFileParser.get_dependent_tier(dep_tier)
+        desired_output = ('eng', 'A new thing')
+        self.assertEqual(actual_output, desired_output)
+
 
 ###############################################################################
 
@@ -785,6 +833,7 @@ class TestACQDIVCHATReaderIterators(unittest.TestCase):
                    '%cod:\tThis is the cod tier\n'
                    '*MOT:\tThis is the second mainline of MOT .\n'
                    '@End')
+        cls.session = session
         cls.reader = CHATReader(io.StringIO(session))
 
     def test_load_next_speaker(self):
@@ -825,6 +874,28 @@ class TestACQDIVCHATReaderIterators(unittest.TestCase):
         ]
         self.assertEqual(actual_output, desired_output)
 
+    def test_iter_speakers(self):
+        """Test iter_speakers."""
+        reader = CHATReader(io.StringIO(self.session))
+        actual_output = []
+        for participant in reader.iter_speakers():
+            actual_output.append((participant.code,
+                                  reader.get_speaker_label(),
+                                  reader.get_speaker_name()))
+        desired_output = [('MOT', 'MOT', 'Kim'), ('CHI', 'CHI', 'Daniel')]
+        self.assertEqual(actual_output, desired_output)
+
+    def test_iter_records(self):
+        """Test iter_records."""
+        reader = CHATReader(io.StringIO(self.session))
+        actual_output = []
+        for record in reader.iter_records():
+            actual_output.append((record.uid,
+                                  reader.get_uid(),
+                                  reader.get_record_speaker_label()))
+        desired_output = [(0, '0', 'MOT'), (1, '1', 'CHI'), (2, '2', 'MOT')]
+        self.assertEqual(actual_output, desired_output)
+
 
 class TestACQDIVCHATReaderGeneric(unittest.TestCase):
     """Class to test all static and class methods of CHATReader."""
@@ -886,6 +957,13 @@ class TestACQDIVCHATReaderGeneric(unittest.TestCase):
         desired_output = 'gloss'
         self.assertEqual(actual_output, desired_output)
 
+    def test_get_morphology(self):
+        """Test get_morphology with a missing gloss."""
+        reader = CHATReader(io.StringIO(''))
+        actual_output = reader.get_morphology('a-b', 'A', 'N-sfx')
+        desired_output = ([''], ['A'], [''])
+        self.assertEqual(actual_output, desired_output)
+
     def test_get_morpheme_language(self):
         """Test get_morpheme_language. Should return an empty string."""
         seg = 'Hatschi'
@@ -152,4 +152,18 @@ class SentenceTypeExtractor(unittest.TestCase):
         utterance = 'Is this a test ? '
         actual_output = SentTypExtr.get_utterance_terminator(utterance)
         desired_output = '?'
-        self.assertEqual(actual_output, desired_output)
\ No newline at end of file
+        self.assertEqual(actual_output, desired_output)
+
+    def test_get_utterance_terminator_multiple_postcodes(self):
+        """Test get_utterance_terminator with several postcodes."""
+        utterance = 'this is a test +... [+ neg] [+ req]'
+        actual_output = SentTypExtr.get_utterance_terminator(utterance)
+        desired_output = '+...'
+        self.assertEqual(actual_output, desired_output)
+
+    def test_get_utterance_terminator_words_after_postcode(self):
+        """Test get_utterance_terminator with words after the postcode."""
+        utterance = '? [+ bch] +/. , ab'
+        actual_output = SentTypExtr.get_utterance_terminator(utterance)
+        desired_output = '?'
+        self.assertEqual(actual_output, desired_output)
@@ -68,7 +68,7 @@ class TestInuktitutReader(unittest.TestCase):
 
     def test_get_start_time_start_time_absent(self):
         """Test get_start_time for a case no start time existing."""
-        self.reader._dependent_tiers = {
+        self.reader.record.dependent_tiers = {
             'utt': 'ha be'
         }
         actual_output = self.reader.get_start_time()
@@ -16,12 +16,13 @@ from acqdiv.parsers.corpora.main.yucatec.reader \
 @pytest.mark.usefixtures('dummy_cha')
 class TestYucatecParser(unittest.TestCase):
 
+    session_str = ('*LOR:\tbaʼax .\n%xpho:\tbaaʼx\n%xmor:\tINT|baʼax .\n'
+                   '%xspn:\tqué .\n@End')
+
     def test_get_reader(self):
         """Test get_reader. (Yucatec)"""
-        session_str = ('*LOR:\tbaʼax .\n%xpho:\tbaaʼx\n%xmor:\tINT|baʼax .\n'
-                       '%xspn:\tqué .\n@End')
         actual_reader = YucatecSessionParser.get_reader(
-            io.StringIO(session_str))
+            io.StringIO(self.session_str))
         self.assertTrue(isinstance(actual_reader, YucatecReader))
 
     def test_get_cleaner(self):
@@ -31,48 +32,36 @@ class TestYucatecParser(unittest.TestCase):
 
     def test_parse(self):
         """Test parse() method."""
-        session_str = ('*LOR:\tbaʼax .\n%xpho:\tbaaʼx\n%xmor:\tINT|baʼax .\n'
-                       '%xspn:\tqué .\n@End')
         parser = YucatecSessionParser(self.dummy_cha_path)
-        parser.reader = YucatecReader(io.StringIO(session_str))
+        parser.reader = YucatecReader(io.StringIO(self.session_str))
         session = parser.parse()
         utt = session.utterances[0]
 
-        utt_list = [
-            utt.source_id == 'dummy_0',
-            utt.addressee is None,
-            utt.utterance_raw == 'baʼax .',
-            utt.utterance == 'baʼax',
-            utt.translation == 'qué .',
-            utt.morpheme_raw == 'INT|baʼax .',
-            utt.gloss_raw == 'INT|baʼax .',
-            utt.pos_raw == 'INT|baʼax .',
-            utt.sentence_type == 'default',
-            utt.start_raw == '',
-            utt.end_raw == '',
-            utt.comment == '',
-            utt.warning == ''
-        ]
+        self.assertEqual(utt.source_id, 'dummy_0')
+        self.assertIsNone(utt.addressee)
+        self.assertEqual(utt.utterance_raw, 'baʼax .')
+        self.assertEqual(utt.utterance, 'baʼax')
+        self.assertEqual(utt.translation, 'qué .')
+        self.assertEqual(utt.morpheme_raw, 'INT|baʼax .')
+        self.assertEqual(utt.gloss_raw, 'INT|baʼax .')
+        self.assertEqual(utt.pos_raw, 'INT|baʼax .')
+        self.assertEqual(utt.sentence_type, 'default')
+        self.assertEqual(utt.start_raw, '')
+        self.assertEqual(utt.end_raw, '')
+        self.assertEqual(utt.comment, '')
+        self.assertEqual(utt.warning, '')
 
         w = utt.words[0]
 
-        words_list = [
-            w.word_language == '',
-            w.word == 'baʼax',
-            w.word_actual == 'baʼax',
-            w.word_target == 'baʼax',
-            w.warning == ''
-        ]
+        self.assertEqual(w.word_language, '')
+        self.assertEqual(w.word, 'baʼax')
+        self.assertEqual(w.word_actual, 'baʼax')
+        self.assertEqual(w.word_target, 'baʼax')
+        self.assertEqual(w.warning, '')
 
         m = utt.morphemes[0][0]
 
-        morpheme_list = [
-            m.gloss_raw == '',
-            m.morpheme == 'baʼax',
-            m.morpheme_language == '',
-            m.pos_raw == 'INT'
-        ]
-
-        assert (False not in utt_list
-                and False not in words_list
-                and False not in morpheme_list)
+        self.assertEqual(m.gloss_raw, '')
+        self.assertEqual(m.morpheme, 'baʼax')
+        self.assertEqual(m.morpheme_language, '')
+        self.assertEqual(m.pos_raw, 'INT')
@@ -0,0 +1,58 @@
+import unittest
+from pathlib import Path
+
+from acqdiv.parsers.corpora.main.cree.corpus_parser import CreeCorpusParser
+
+
+class TestCorpusParser(unittest.TestCase):
+    """Class to test the CorpusParser."""
+
+    def setUp(self):
+        sessions = Path(__file__).parent / 'resources/corpora/Cree/cha/*.cha'
+        self.cfg = {
+            'iso639-3': 'crl',
+            'glottolog_code': 'moos1236',
+            'corpus': 'Cree',
+            'language': 'Cree',
+            'owner': 'owner',
+            'acronym': 'Cree',
+            'name': 'Cree',
+            'sessions': str(sessions)
+        }
+
+    def test_iter_sessions_parallel(self):
+        """Test iter_sessions with several workers. (CorpusParser)"""
+        sequential = CreeCorpusParser(self.cfg, disable_pbar=True)
+        parallel = CreeCorpusParser(self.cfg, disable_pbar=True, workers=2)
+
+        sequential_sessions = list(sequential.parse().sessions)
+        parallel_sessions = list(parallel.parse().sessions)
+
+        actual_output = [(session.source_id,
+                          [u.utterance_raw for u in session.utterances])
+                         for session in parallel_sessions]
+        desired_output = [(session.source_id,
+                           [u.utterance_raw for u in session.utterances])
+                          for session in sequential_sessions]
+        self.assertEqual(actual_output, desired_output)
+        self.assertTrue(actual_output)
+
+    def test_iter_parsed_sessions_more_chunks_than_workers(self):
+        """Test iter_parsed_sessions with more chunks than workers."""
+        parser = CreeCorpusParser(self.cfg, disable_pbar=True, workers=2,
+                                  chunksize=2)
+        session_paths = [self.cfg['sessions'].replace('*', 'Cree')] * 5
+        sessions = list(parser.iter_parsed_sessions(session_paths))
+        actual_output = [session.source_id for session in sessions]
+        desired_output = ['Cree'] * 5
+        self.assertEqual(actual_output, desired_output)
+
+    def test_init_invalid_workers(self):
+        """Test __init__ with fewer than one worker."""
+        for workers in (0, -1):
+            with self.assertRaises(ValueError):
+                CreeCorpusParser(self.cfg, disable_pbar=True, workers=workers)
+
+
+if __name__ == '__main__':
+    unittest.main()